@@ -1,7 +1,9 @@
 import os
 import json
 from datetime import datetime
+from pathlib import Path
 from src.postman_doc_generator import PostmanDocGenerator
+from src.collection_sources import iter_collections, assign_output_names
 
 
 def main():
@@ -13,42 +15,44 @@ def main():
         return
 
     generator = PostmanDocGenerator()
-    collection_files = [f for f in os.listdir(folder) if f.endswith(".postman_collection.json")]
-    
-    if not collection_files:
+    found_sources = {}
+
+    # Primeira passada só lista os nomes, para que os nomes de saída não dependam
+    # da ordem de leitura das coleções.
+    output_names = assign_output_names(source.name for source in iter_collections(folder, quiet=True))
+
+    if not output_names:
         print(f"❌ Nenhum arquivo de coleção encontrado em: {folder}")
         return
 
-    print(f"📁 Processando {len(collection_files)} coleções...")
+    print(f"📁 Processando {len(output_names)} coleções...")
 
-    for filename in collection_files:
+    for source in iter_collections(folder):
         start_time = datetime.now()
-        name = filename.replace(".postman_collection.json", "")
-        json_path = os.path.join(folder, filename)
-        output_html = f"{name.lower()}.html"
+        output_html = f"{output_names.get(source.name, source.output_name)}.html"
+        source_name = f"{Path(folder).as_posix()}/{source.name}"
+        found_sources[source_name] = output_html
 
         try:
+            collection = source.load()
             generator.output_file = output_html
-            generator.generate_documentation(json_path)
+            generator.generate_documentation_from_collection(collection, source_name)
 
-            with open(json_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-                title = data.get("info", {}).get("name", name)
-            
+            title = collection.get("info", {}).get("name", source.filename.replace(".postman_collection.json", ""))
             generated_docs.append({"file": output_html, "title": title})
             
             processing_time = (datetime.now() - start_time).total_seconds()
-            print(f"✅ Gerado: {output_html} a partir de {filename} ({processing_time:.2f}s)")
+            print(f"✅ Gerado: {output_html} a partir de {source.name} ({processing_time:.2f}s)")
 
         except FileNotFoundError as e:
             print(f"❌ Arquivo não encontrado: {e}")
         except json.JSONDecodeError as e:
-            print(f"❌ Erro no JSON do arquivo {filename}: {e}")
+            print(f"❌ Erro no JSON do arquivo {source.name}: {e}")
         except Exception as e:
-            print(f"❌ Erro inesperado ao processar {filename}: {e}")
+            print(f"❌ Erro inesperado ao processar {source.name}: {e}")
 
     if generated_docs:
-        generator.generate_index(generated_docs)
+        generator.generate_index(generated_docs, found_sources, folder)
         print(f"🎉 Processamento concluído! {len(generated_docs)} documentações geradas.")
     else:
         print("❌ Nenhuma documentação foi gerada.")
@@ -0,0 +1,137 @@
+const globalSearchInput = document.querySelector("#global-search-input");
+const globalSearchResults = document.querySelector("#global-search-results");
+const collectionList = document.querySelector("#collection-list");
+const availableShards = new Set((globalSearchInput.dataset.shards || "").split(",").filter(Boolean));
+const loadedShards = {};
+const pendingShards = {};
+const maxSearchResults = 50;
+const httpMethods = new Set(["get", "post", "put", "patch", "delete", "head", "options"]);
+
+window.postmanSearch = {
+    loadShard(key, entries) {
+        loadedShards[key] = entries.map((entry) => {
+            const [method, path, name, folder, page, anchor, title] = entry;
+            const tokens = tokenize(`${method} ${path} ${name} ${folder}`);
+            return { method, path, name, folder, page, anchor, title, tokens };
+        });
+    },
+};
+
+function tokenize(text) {
+    return text.toLowerCase().match(/[\p{L}\p{N}_]+/gu) || [];
+}
+
+function getShardKey(token) {
+    return [...token.slice(0, 2)].map((char) => (/[a-z0-9]/.test(char) ? char : "_")).join("");
+}
+
+function isMethodPrefix(token) {
+    return [...httpMethods].some((method) => method.startsWith(token));
+}
+
+function getShardKeys(queryTokens) {
+    const termTokens = queryTokens
+        .filter((token) => token.length >= 2 && !isMethodPrefix(token))
+        .sort((a, b) => b.length - a.length);
+
+    if (termTokens.length) return [getShardKey(termTokens[0])];
+
+    // Busca só por método (ou início de um, como "del"): carrega os fragmentos
+    // "m_<método>" e também o do termo, já que "pa" pode ser "/payments".
+    const keys = new Set();
+
+    queryTokens.forEach((token) => {
+        if (token.length >= 2) keys.add(getShardKey(token));
+        httpMethods.forEach((method) => {
+            if (method.startsWith(token)) keys.add(`m_${method}`);
+        });
+    });
+
+    return [...keys];
+}
+
+async function loadEntries(keys) {
+    const shards = await Promise.all(keys.map(loadShard));
+    const entries = new Map();
+
+    shards.flat().forEach((entry) => {
+        entries.set(`${entry.page}#${entry.anchor}#${entry.method}#${entry.path}`, entry);
+    });
+
+    return [...entries.values()];
+}
+
+function loadShard(key) {
+    if (loadedShards[key]) return Promise.resolve(loadedShards[key]);
+    if (!availableShards.has(key)) return Promise.resolve([]);
+
+    if (!pendingShards[key]) {
+        pendingShards[key] = new Promise((resolve) => {
+            const script = document.createElement("script");
+            script.src = `search/shard-${key}.js`;
+            script.onload = () => resolve(loadedShards[key] || []);
+            script.onerror = () => resolve([]);
+            document.head.appendChild(script);
+        });
+    }
+
+    return pendingShards[key];
+}
+
+function matchesQuery(entry, queryTokens) {
+    return queryTokens.every((queryToken) => entry.tokens.some((token) => token.startsWith(queryToken)));
+}
+
+function renderResults(results) {
+    globalSearchResults.innerHTML = "";
+
+    results.slice(0, maxSearchResults).forEach((entry) => {
+        const item = document.createElement("li");
+        const link = document.createElement("a");
+        const folder = entry.folder ? ` › ${entry.folder}` : "";
+
+        link.href = `${encodeURIComponent(entry.page)}#${encodeURIComponent(entry.anchor)}`;
+        link.rel = "noopener noreferrer";
+        link.textContent = `${entry.method} ${entry.path} — ${entry.name} (${entry.title}${folder})`;
+
+        item.appendChild(link);
+        globalSearchResults.appendChild(item);
+    });
+
+    if (!results.length) {
+        const item = document.createElement("li");
+        item.textContent = "Nenhum endpoint encontrado.";
+        globalSearchResults.appendChild(item);
+    }
+}
+
+function handleGlobalSearchInput() {
+    let currentQuery = "";
+
+    globalSearchInput.addEventListener("input", async (event) => {
+        const query = event.target.value;
+        const queryTokens = tokenize(query);
+        currentQuery = query;
+
+        if (!queryTokens.length) {
+            globalSearchResults.innerHTML = "";
+            collectionList.style.display = "";
+            return;
+        }
+
+        const shardKeys = getShardKeys(queryTokens);
+        collectionList.style.display = "none";
+
+        if (!shardKeys.length) {
+            globalSearchResults.innerHTML = "<li>Digite ao menos 2 caracteres do caminho, nome ou pasta, ou um método HTTP.</li>";
+            return;
+        }
+
+        const entries = await loadEntries(shardKeys);
+        if (currentQuery !== query) return;
+
+        renderResults(entries.filter((entry) => matchesQuery(entry, queryTokens)));
+    });
+}
+
+handleGlobalSearchInput();
@@ -0,0 +1,140 @@
+import hashlib
+import json
+import os
+import posixpath
+import re
+import tarfile
+import zipfile
+import zlib
+
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional
+
+COLLECTION_SUFFIX = ".postman_collection.json"
+ZIP_SUFFIXES = (".zip",)
+TAR_SUFFIXES = (".tar", ".tar.gz", ".tgz", ".tar.bz2", ".tbz2", ".tar.xz", ".txz")
+
+
+class CollectionSource:
+    def __init__(self, name: str, loader: Callable[[], Dict[str, Any]]):
+        self.name = name
+        self._loader = loader
+
+    @property
+    def filename(self) -> str:
+        return self.name.rsplit("/", 1)[-1]
+
+    @property
+    def output_name(self) -> str:
+        return get_output_name(self.name)
+
+    def load(self) -> Dict[str, Any]:
+        return self._loader()
+
+
+def get_output_name(name: str) -> str:
+    if "/" not in name:
+        return name[:-len(COLLECTION_SUFFIX)].lower()
+
+    namespaced = name[:-len(COLLECTION_SUFFIX)].replace("/", "__")
+    return re.sub(r'[^\w.-]', '-', namespaced).lower()
+
+
+def _is_canonical_name(name: str) -> bool:
+    segments = name[:-len(COLLECTION_SUFFIX)].split("/")
+    return all(
+        segment == re.sub(r'[^\w.-]', '-', segment).lower()
+        and "__" not in segment
+        and not segment.startswith("_")
+        and not segment.endswith("_")
+        for segment in segments
+    )
+
+
+def assign_output_names(names: Iterable[str]) -> Dict[str, str]:
+    groups: Dict[str, list] = {}
+    for name in names:
+        groups.setdefault(get_output_name(name), []).append(name)
+
+    # Só nomes que colidem recebem sufixo, derivado do caminho de origem (e não da ordem
+    # de leitura); um nome canônico, que não muda ao ser normalizado, mantém o nome simples.
+    output_names = {}
+    for output_name, group in groups.items():
+        for name in group:
+            clashes = output_name == "index" or (len(group) > 1 and not _is_canonical_name(name))
+            suffix = hashlib.sha1(name.encode("utf-8")).hexdigest()[:8]
+            output_names[name] = f"{output_name}-{suffix}" if clashes else output_name
+
+    return output_names
+
+
+def _load_plain_file(path: Path) -> Dict[str, Any]:
+    with open(path, "rb") as f:
+        return json.load(f)
+
+
+def _load_stream(stream) -> Dict[str, Any]:
+    with stream:
+        return json.load(stream)
+
+
+def _member_name(name: str) -> Optional[str]:
+    name = posixpath.normpath(name).lstrip("/")
+    basename = posixpath.basename(name)
+
+    # Arquivos AppleDouble ("__MACOSX/", "._*") criados pelo macOS não são coleções.
+    if name.startswith("__MACOSX/") or basename.startswith("._") or not name.endswith(COLLECTION_SUFFIX):
+        return None
+    return name
+
+
+def _iter_zip(path: Path, prefix: str) -> Iterator[CollectionSource]:
+    with zipfile.ZipFile(path) as archive:
+        for info in archive.infolist():
+            member_name = _member_name(info.filename)
+            if info.is_dir() or not member_name:
+                continue
+
+            yield CollectionSource(
+                f"{prefix}/{member_name}",
+                lambda info=info: _load_stream(archive.open(info))
+            )
+
+
+def _iter_tar(path: Path, prefix: str) -> Iterator[CollectionSource]:
+    # Modo "r|*" descompacta em fluxo contínuo: cada coleção deve ser carregada
+    # antes de avançar para o próximo membro do arquivo.
+    with tarfile.open(path, "r|*") as archive:
+        for member in archive:
+            member_name = _member_name(member.name)
+            if not member.isfile() or not member_name:
+                continue
+
+            yield CollectionSource(
+                f"{prefix}/{member_name}",
+                lambda member=member: _load_stream(archive.extractfile(member))
+            )
+
+
+def iter_collections(folder: str, quiet: bool = False) -> Iterator[CollectionSource]:
+    root = Path(folder)
+
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames.sort()
+
+        for filename in sorted(filenames):
+            path = Path(dirpath) / filename
+            name = path.relative_to(root).as_posix()
+            lower_name = filename.lower()
+
+            if filename.endswith(COLLECTION_SUFFIX):
+                yield CollectionSource(name, lambda path=path: _load_plain_file(path))
+            elif lower_name.endswith(ZIP_SUFFIXES + TAR_SUFFIXES):
+                try:
+                    if lower_name.endswith(ZIP_SUFFIXES):
+                        yield from _iter_zip(path, name)
+                    else:
+                        yield from _iter_tar(path, name)
+                except (zipfile.BadZipFile, tarfile.TarError, OSError, EOFError, zlib.error) as e:
+                    if not quiet:
+                        print(f"❌ Erro ao ler o arquivo compactado {name}: {e}")
@@ -12,6 +12,7 @@ from dotenv import load_dotenv, find_dotenv
 from src.utils import *
 from src.html_generator import HTMLGenerator
 from src.content_processor import ContentProcessor
+from src.search_index import SearchIndex
 
 load_dotenv(find_dotenv(), override=True)   
 
@@ -20,6 +21,7 @@ class PostmanDocGenerator:
     def __init__(self, output_file: str = "docs.html"):
         self.output_file = output_file
         self.html_output: List[str] = []
+        self.search_entries: List[Dict[str, str]] = []
         self._setup_logging()
         
         self.max_responses = int(os.getenv("MAX_RESPONSES", "2"))
@@ -29,6 +31,7 @@ class PostmanDocGenerator:
         
         self.content_processor = ContentProcessor(self.max_json_length, self.json_start_pattern)
         self.html_generator = HTMLGenerator()
+        self.search_index = SearchIndex()
     
     def _setup_logging(self) -> None:
         logging.basicConfig(
@@ -94,7 +97,7 @@ class PostmanDocGenerator:
             self.html_output.append('<p class="error">Error processing content</p>')
             self.html_output.append('</div>')
 
-    def _parse_item(self, item: Dict[str, Any]) -> None:
+    def _parse_item(self, item: Dict[str, Any], folder: str = "") -> None:
         try:
             query_params = ""
             request = item.get("request", {}) 
@@ -129,6 +132,14 @@ class PostmanDocGenerator:
             item_name = item.get("name", "Sem nome")
             item_id = generate_item_id(item_name)
 
+            self.search_entries.append({
+                "method": method,
+                "path": extract_url_path(url_data),
+                "name": item_name,
+                "folder": folder,
+                "anchor": item_id
+            })
+
             self.html_output.append(f'<h2 id="{item_id}">{escape(item_name)}</h2>')
 
             self.html_output.append(f'''
@@ -215,7 +226,7 @@ class PostmanDocGenerator:
         except Exception as e:
             self.logger.error(f"Erro ao processar item '{item.get('name', 'Desconhecido')}': {e}")
     
-    def _process_items(self, collection: Dict[str, Any], items: List[Dict[str, Any]], level: int = 0) -> List[Dict[str, str]]:
+    def _process_items(self, collection: Dict[str, Any], items: List[Dict[str, Any]], level: int = 0, folder: str = "") -> List[Dict[str, str]]:
         collection_items = collection.get("item", [])
         toc_items = []
 
@@ -252,11 +263,11 @@ class PostmanDocGenerator:
                         )
 
                     if has_children:
-                        folder_toc = self._process_items(collection, item["item"], level + 1)
+                        folder_toc = self._process_items(collection, item["item"], level + 1, folder_name)
                         toc_items.extend(folder_toc)
 
                     if item.get("request"):
-                        self._parse_item(item)
+                        self._parse_item(item, folder)
 
                 else:
                     item_name = item.get("name", "Sem nome")
@@ -278,7 +289,7 @@ class PostmanDocGenerator:
                         "method": item.get("request", {}).get("method", None)
                     })
 
-                    self._parse_item(item)
+                    self._parse_item(item, folder)
                     
             except Exception as e:
                 self.logger.error(f"Error processing item: {e}")
@@ -303,13 +314,17 @@ class PostmanDocGenerator:
                 collection = json.load(file)
         except json.JSONDecodeError as e:
             raise json.JSONDecodeError(f"Erro ao decodificar JSON: {e}", e.doc, e.pos)
-        
+
+        self.generate_documentation_from_collection(collection, json_path.as_posix())
+
+    def generate_documentation_from_collection(self, collection: Dict[str, Any], source_path: str = "") -> None:
         info = collection.get("info", {})
         collection_name = str(escape(info.get("name", 'API'))).capitalize()
         collection_description = info.get("description", "")
         collection_version = info.get("version", "")
         
         self.html_output = self.html_generator.generate_html_header(collection_name)
+        self.search_entries = []
         
         items = collection.get("item", [])
         toc_items = []
@@ -346,14 +361,18 @@ class PostmanDocGenerator:
 
         with open(output_path, "w", encoding="utf-8") as file:
             file.write("\n".join(self.html_output))
+
+        self.search_index.save_collection(self.output_file, info.get("name", "API"), self.search_entries, source_path)
         
         self.logger.info(f"✅ Documentação gerada com sucesso: {output_path.absolute()}")
 
-    def generate_index(self, generated_docs: list):
+    def generate_index(self, generated_docs: list, found_sources: Dict[str, str] = None, folder: str = ""):
         index_path = Path("output/index.html")
         index_path.parent.mkdir(parents=True, exist_ok=True)
 
         try:
+            shard_keys = self.search_index.build(found_sources, folder)
+
             with open(index_path, "w", encoding="utf-8") as f:
                 f.write("<!DOCTYPE html>\n<html lang='pt-BR'>\n<head>\n")
                 f.write("  <meta charset='UTF-8'>\n")
@@ -363,14 +382,18 @@ class PostmanDocGenerator:
                 f.write(get_file("public/api.js", 'script'))
                 f.write("</head>\n<body>\n")
                 f.write("<div class='container'>\n")
-                f.write("<h1>Documentação das APIs</h1>\n<ul>\n")
+                f.write("<h1>Documentação das APIs</h1>\n")
+                f.write(f"<input id='global-search-input' placeholder='🔍 Pesquisar endpoint em todas as coleções...' data-shards='{','.join(shard_keys)}' />\n")
+                f.write("<ul id='global-search-results'></ul>\n<ul id='collection-list'>\n")
 
                 for doc in generated_docs:
                     file = escape(doc["file"])
                     title = escape(doc["title"])
                     f.write(f"<li><a href='{file}' rel='noopener noreferrer'>📁 {title}</a></li>\n")
 
-                f.write("</ul>\n</div>\n</body>\n</html>")
+                f.write("</ul>\n</div>\n")
+                f.write(get_file("public/search.js", 'script'))
+                f.write("</body>\n</html>")
 
             print(f"✅ Índice gerado em: {index_path}")
             
@@ -0,0 +1,103 @@
+import json
+import logging
+import re
+
+from pathlib import Path
+from typing import Dict, List, Any, Optional
+
+HTTP_METHODS = {"get", "post", "put", "patch", "delete", "head", "options"}
+
+
+class SearchIndex:
+    def __init__(self, output_dir: str = "output/search"):
+        self.output_dir = Path(output_dir)
+        self.collections_dir = self.output_dir / "collections"
+        self.token_pattern = re.compile(r'\w+')
+        self.logger = logging.getLogger(__name__)
+
+    def _collection_path(self, page: str) -> Path:
+        return self.collections_dir / f"{Path(page).stem}.json"
+
+    def _shard_key(self, token: str) -> str:
+        return "".join(char if char.isascii() and char.isalnum() else "_" for char in token[:2])
+
+    def _entry_shards(self, entry: List[str]) -> set:
+        # O campo do método fica fora das chaves de termos: senão um único fragmento teria
+        # todos os GETs (ou POSTs). Buscas só por método usam os fragmentos "m_<método>".
+        method, path, name, folder = entry[:4]
+        text = f"{path} {name} {folder}".lower()
+        keys = {self._shard_key(token) for token in self.token_pattern.findall(text)}
+
+        if method.lower() in HTTP_METHODS:
+            keys.add(f"m_{method.lower()}")
+        return keys
+
+    def _is_stale(self, data: Dict[str, Any], found_sources: Optional[Dict[str, str]], folder: str) -> bool:
+        source = data.get("source", "")
+        page = data.get("page", "")
+
+        if not (self.output_dir.parent / page).is_file():
+            return True
+
+        if found_sources is not None and folder and source.startswith(folder + "/"):
+            return found_sources.get(source) != page
+        return False
+
+    def save_collection(self, page: str, title: str, entries: List[Dict[str, Any]], source: str = "") -> None:
+        self.collections_dir.mkdir(parents=True, exist_ok=True)
+
+        data = {
+            "page": page,
+            "title": title,
+            "source": source,
+            "entries": [
+                [entry["method"], entry["path"], entry["name"], entry["folder"], page, entry["anchor"], title]
+                for entry in entries
+            ],
+        }
+
+        with open(self._collection_path(page), "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+
+    def build(self, found_sources: Optional[Dict[str, str]] = None, folder: str = "") -> List[str]:
+        shards: Dict[str, List[List[str]]] = {}
+        folder = Path(folder).as_posix() if folder else ""
+
+        for collection_path in sorted(self.collections_dir.glob("*.json")):
+            try:
+                with open(collection_path, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+
+                if self._is_stale(data, found_sources, folder):
+                    self.logger.info(f"Removendo índice de busca sem origem: {collection_path}")
+                    collection_path.unlink()
+                    continue
+
+                collection_shards = [
+                    (key, entry)
+                    for entry in data.get("entries", [])
+                    for key in self._entry_shards(entry)
+                ]
+            except (OSError, ValueError, TypeError, AttributeError) as e:
+                self.logger.warning(f"Índice de busca inválido em {collection_path}: {e}")
+                continue
+
+            for key, entry in collection_shards:
+                shards.setdefault(key, []).append(entry)
+
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+
+        for key, entries in shards.items():
+            shard_path = self.output_dir / f"shard-{key}.js"
+            content = f"window.postmanSearch.loadShard({json.dumps(key)}, {json.dumps(entries, ensure_ascii=False)});\n"
+
+            if shard_path.exists() and shard_path.read_text(encoding="utf-8") == content:
+                continue
+
+            shard_path.write_text(content, encoding="utf-8")
+
+        for shard_path in self.output_dir.glob("shard-*.js"):
+            if shard_path.stem[len("shard-"):] not in shards:
+                shard_path.unlink()
+
+        return sorted(shards)
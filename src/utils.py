@@ -6,6 +6,7 @@ from pygments import highlight
 from pygments.lexers import JsonLexer
 from pygments.formatters import HtmlFormatter
 from html import escape
+from urllib.parse import urlsplit
 
 load_dotenv(find_dotenv(), override=True)   
 
@@ -36,6 +37,37 @@ def format_json(json_data: str) -> str:
 def generate_item_id(name: str) -> str:
     return name.lower().replace(" ", "-").replace("/", "-")
 
+def extract_url_path(url_data: Any) -> str:
+    if isinstance(url_data, dict):
+        path = url_data.get("path")
+
+        if isinstance(path, list):
+            segments = [
+                str(segment.get("value", "")) if isinstance(segment, dict) else str(segment)
+                for segment in path
+            ]
+            return "/" + "/".join(segments)
+
+        if isinstance(path, str) and path:
+            return path if path.startswith("/") else "/" + path
+
+    raw = url_data if isinstance(url_data, str) else (url_data or {}).get("raw", "") or ""
+    raw = re.sub(r'^\s*\{\{[^}]*\}\}', '', raw.strip())
+
+    if raw.startswith("://"):
+        return urlsplit("http" + raw).path or "/"
+    if "://" in raw:
+        return urlsplit(raw).path or "/"
+
+    path = raw.split("?")[0].split("#")[0]
+    if not path.startswith("/"):
+        host, _, rest = path.partition("/")
+        # Sem esquema, um primeiro segmento como "localhost:3000" ou "api.x.com" é o host.
+        if host == "localhost" or "." in host or ":" in host:
+            path = rest
+
+    return path if path.startswith("/") else "/" + path
+
 def get_status_class(status_code: int) -> str:
     if 200 <= status_code < 300:
         return "success"